@@ -1,51 +1,276 @@
+import base64
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import grp
+import hashlib
+import hmac
+import io
+import logging
 import os
+import pwd
 from dotenv import load_dotenv
 import boto3
-from botocore.exceptions import NoCredentialsError
-from hdfs import InsecureClient
-from typing import Dict, Tuple
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import ClientError, NoCredentialsError
+from hdfs import HdfsError, InsecureClient
+import requests
+from requests.adapters import HTTPAdapter
+from typing import Any, BinaryIO, Dict, FrozenSet, List, NamedTuple, Optional, Tuple, Union
 import subprocess
+import time
+
+
+ENVIRONMENT_VARIABLES = ('HDFS_URL', 'HDFS_USER', 'HDFS_PATH', 'S3_BUCKET_NAME', 'S3_FILE_KEY',
+                         'AWS_ACCESS_KEY', 'AWS_SECRET_KEY', 'AWS_REGION',
+                         'S3_USE_ACCELERATE', 'TRANSFER_PART_SIZE', 'TRANSFER_PARALLELISM')
+
+MULTIPART_THRESHOLD = 8 * 1024 * 1024
+MULTIPART_CHUNKSIZE = 16 * 1024 * 1024
+MAX_CONCURRENCY = 16
+MAX_PARTS = 10000
+MIN_PART_SIZE = 5 * 1024 * 1024
+MAX_PART_SIZE = 5 * 1024 * 1024 * 1024
+
+TRANSFER_CONFIG = TransferConfig(multipart_threshold=MULTIPART_THRESHOLD,
+                                 multipart_chunksize=MULTIPART_CHUNKSIZE,
+                                 max_concurrency=MAX_CONCURRENCY,
+                                 use_threads=True)
+
+_dotenv_loaded = False
+
+logger = logging.getLogger(__name__)
 
 
 def load_environment_variables() -> Dict[str, str]:
     """
     Load environment variables from .env file.
 
+    The .env file is only parsed on the first call; later calls read the
+    already populated process environment.
+
     Returns:
         Dict[str, str]: A dictionary containing environment variables and their values.
     """
-    load_dotenv()
-    return {
-        'hdfs_url': os.getenv('HDFS_URL'),
-        'hdfs_user': os.getenv('HDFS_USER'),
-        'hdfs_path': os.getenv('HDFS_PATH'),
-        's3_bucket_name': os.getenv('S3_BUCKET_NAME'),
-        's3_file_key': os.getenv('S3_FILE_KEY'),
-        'aws_access_key': os.getenv('AWS_ACCESS_KEY'),
-        'aws_secret_key': os.getenv('AWS_SECRET_KEY'),
-        'aws_region': os.getenv('AWS_REGION')
-    }
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        load_dotenv()
+        _dotenv_loaded = True
+    env = os.environ
+    return {name.lower(): env.get(name) for name in ENVIRONMENT_VARIABLES}
+
+
+class TransferPolicy(NamedTuple):
+    """
+    Tuning for the multipart HDFS to S3 pipeline.
 
+    The pipeline is bound by network latency and bandwidth on both the HDFS and
+    the S3 side, not by CPU: throughput comes from keeping enough parts in
+    flight to hide round-trips. Tune part size and parallelism per deployment
+    (on-prem HDFS and cross-region S3 favour different values) rather than
+    optimizing the per-byte work.
 
-def initialize_clients(config: Dict[str, str]) -> Tuple[InsecureClient, boto3.client]:
+    Attributes:
+        part_size (int): The number of bytes read from HDFS and uploaded per part.
+        parallelism (int): The number of parts transferred at once.
+    """
+    part_size: int = MULTIPART_CHUNKSIZE
+    parallelism: int = MAX_CONCURRENCY
+
+
+class UploadResult(NamedTuple):
+    """
+    Outcome of an upload to S3.
+
+    Attributes:
+        etag (Optional[str]): The ETag of the uploaded object, if S3 returned it to the uploader.
+        checksum (Optional[str]): The base64-encoded SHA-256 checksum S3 stored for the object, if S3
+            returned it to the uploader. For multipart uploads this is a checksum of the part
+            checksums, ending in "-<part count>".
+        content_checksum (Optional[str]): The base64-encoded SHA-256 of the whole content, computed
+            locally during the upload, if known.
+    """
+    etag: Optional[str]
+    checksum: Optional[str]
+    content_checksum: Optional[str] = None
+
+
+def load_transfer_policy(config: Dict[str, str]) -> TransferPolicy:
+    """
+    Build the transfer policy from the configuration, falling back to the defaults.
+
+    Args:
+        config (Dict[str, str]): Configuration dictionary as returned by load_environment_variables.
+
+    Returns:
+        TransferPolicy: The policy to run the transfer with.
+
+    Raises:
+        ValueError: If the part size is outside the S3 limits or the parallelism is below one.
+    """
+    defaults = TransferPolicy()
+    policy = TransferPolicy(part_size=int(config['transfer_part_size'] or defaults.part_size),
+                            parallelism=int(config['transfer_parallelism'] or defaults.parallelism))
+    if not MIN_PART_SIZE <= policy.part_size <= MAX_PART_SIZE:
+        raise ValueError(f"TRANSFER_PART_SIZE must be between {MIN_PART_SIZE} and {MAX_PART_SIZE} bytes, "
+                         f"got {policy.part_size}")
+    if policy.parallelism < 1:
+        raise ValueError(f"TRANSFER_PARALLELISM must be at least 1, got {policy.parallelism}")
+    return policy
+
+
+def get_available_memory() -> Optional[int]:
+    """
+    Read the memory available for new allocations without swapping.
+
+    Returns:
+        Optional[int]: MemAvailable from /proc/meminfo in bytes, or None if it cannot be read.
+    """
+    try:
+        with open('/proc/meminfo') as meminfo:
+            for line in meminfo:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def get_part_size(length: int, part_size: int) -> int:
+    """
+    Work out the part size a multipart transfer of a file actually uses.
+
+    The requested part size is raised for very large files so the upload stays
+    within S3's limit of 10,000 parts.
+
+    Args:
+        length (int): The size of the file in bytes.
+        part_size (int): The requested number of bytes in each part.
+
+    Returns:
+        int: The number of bytes in each part.
+    """
+    return max(part_size, -(-length // MAX_PARTS))
+
+
+def check_transfer_memory(policy: TransferPolicy, length: int) -> None:
+    """
+    Check that the parts the multipart transfer keeps in flight fit in memory.
+
+    Args:
+        policy (TransferPolicy): The policy the transfer will run with.
+        length (int): The size of the file in bytes.
+
+    Raises:
+        ValueError: If the parts in flight would not fit in the available memory.
+    """
+    available_memory = get_available_memory()
+    if available_memory is None:
+        return
+    part_size = get_part_size(length, policy.part_size)
+    if part_size * policy.parallelism >= available_memory:
+        raise ValueError(f"{policy.parallelism} parts of {part_size} bytes do not fit in "
+                         f"{available_memory} bytes of available memory")
+
+
+@functools.lru_cache(maxsize=16)
+def make_s3_client(region: Optional[str] = None, access_key: Optional[str] = None,
+                   secret_key: Optional[str] = None, endpoint_url: Optional[str] = None,
+                   max_pool: int = 64, retries: int = 10, use_accelerate: bool = False) -> boto3.client:
+    """
+    Create an S3 client that can be shared by concurrent upload threads.
+
+    The connection pool is enlarged beyond botocore's default of 10 so that
+    parallel part uploads reuse open connections instead of opening new ones.
+    Clients are cached per set of arguments, so repeated calls return the same
+    client and connection pool instead of resolving credentials and endpoints
+    again. Pass the returned client to upload_file_to_s3 and transfer_file_to_s3.
+
+    Args:
+        region (Optional[str]): The AWS region of the bucket.
+        access_key (Optional[str]): The AWS access key ID.
+        secret_key (Optional[str]): The AWS secret access key.
+        endpoint_url (Optional[str]): A custom S3 endpoint, or None for the AWS default.
+        max_pool (int): The maximum number of pooled connections.
+        retries (int): The maximum number of attempts per request.
+        use_accelerate (bool): Send requests through S3 Transfer Acceleration, which routes
+            cross-region uploads over the AWS backbone from the nearest edge location.
+            Acceleration must be enabled on the bucket.
+
+    Returns:
+        boto3.client: The S3 client.
+    """
+    config = Config(max_pool_connections=max_pool,
+                    retries={'max_attempts': retries, 'mode': 'adaptive'},
+                    tcp_keepalive=True,
+                    s3={'use_accelerate_endpoint': True, 'addressing_style': 'virtual'} if use_accelerate else None)
+    return boto3.client('s3',
+                        region_name=region,
+                        aws_access_key_id=access_key,
+                        aws_secret_access_key=secret_key,
+                        endpoint_url=endpoint_url,
+                        config=config)
+
+
+def check_connection_pool(s3_client: boto3.client, concurrency: int) -> None:
+    """
+    Warn if an S3 client's connection pool is smaller than the number of concurrent requests.
+
+    Args:
+        s3_client (boto3.client): The S3 client to check.
+        concurrency (int): The number of requests that will be in flight at once.
+    """
+    max_pool = s3_client.meta.config.max_pool_connections
+    if max_pool < concurrency:
+        logger.warning("S3 client pool holds %d connections but %d requests run concurrently; "
+                       "create the client with make_s3_client", max_pool, concurrency)
+
+
+def make_hdfs_session(pool_size: int) -> requests.Session:
+    """
+    Create a requests session that can be shared by concurrent HDFS read threads.
+
+    The default session keeps 10 connections per host, so with more readers
+    the extra WebHDFS and DataNode connections are opened and then thrown away.
+
+    Args:
+        pool_size (int): The number of connections to keep per host.
+
+    Returns:
+        requests.Session: A session whose connection pool holds pool_size connections per host.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def initialize_clients(config: Dict[str, str],
+                       parallelism: int = MAX_CONCURRENCY) -> Tuple[InsecureClient, boto3.client]:
     """
     Initialize HDFS and S3 clients using the provided configuration.
 
+    Both clients are shared by all transfer threads: the HDFS client pools
+    enough connections for the ranged reads, see make_hdfs_session, and the
+    S3 client is built by make_s3_client.
+
     Args:
         config (Dict[str, str]): Configuration dictionary containing HDFS and S3 details.
+        parallelism (int): The number of parts transferred at once.
 
     Returns:
         Tuple[InsecureClient, boto3.client]: A tuple containing HDFS client and S3 client.
     """
-    hdfs_client = InsecureClient(config['hdfs_url'], user=config['hdfs_user'])
-    s3_client = boto3.client('s3', 
-                             region_name=config['aws_region'],
-                             aws_access_key_id=config['aws_access_key'],
-                             aws_secret_access_key=config['aws_secret_key'])
+    hdfs_client = InsecureClient(config['hdfs_url'], user=config['hdfs_user'],
+                                 session=make_hdfs_session(parallelism))
+    use_accelerate = (config['s3_use_accelerate'] or '').lower() in ('1', 'true', 'yes')
+    s3_client = make_s3_client(config['aws_region'], config['aws_access_key'], config['aws_secret_key'],
+                               use_accelerate=use_accelerate)
     return hdfs_client, s3_client
 
 
-def read_file_from_hdfs(hdfs_client: InsecureClient, hdfs_path: str) -> str:
+def read_file_from_hdfs(hdfs_client: InsecureClient, hdfs_path: str) -> bytes:
     """
     Read file content from HDFS.
 
@@ -54,118 +279,392 @@ def read_file_from_hdfs(hdfs_client: InsecureClient, hdfs_path: str) -> str:
         hdfs_path (str): The path of the file in HDFS.
 
     Returns:
-        str: The content of the file.
+        bytes: The raw content of the file.
 
     Raises:
         Exception: If reading from HDFS fails.
     """
     try:
-        with hdfs_client.read(hdfs_path, encoding='utf-8') as reader:
+        with hdfs_client.read(hdfs_path) as reader:
             return reader.read()
     except Exception as e:
-        print(f"Failed to read from HDFS: {e}")
+        logger.error("Failed to read from HDFS: %s", e)
         raise
 
 
-def upload_file_to_s3(s3_client: boto3.client, bucket_name: str, file_key: str, file_content: str) -> None:
+class HashingReader:
+    """
+    Binary stream wrapper that hashes the bytes as they are read.
+
+    Lets an upload compute the SHA-256 of its content in the same pass that
+    sends it, instead of reading the source a second time.
+    """
+
+    def __init__(self, stream: BinaryIO) -> None:
+        self._stream = stream
+        self._digest = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._stream.read(size)
+        self._digest.update(data)
+        return data
+
+    def checksum(self) -> str:
+        """
+        Return the base64-encoded SHA-256 digest of everything read so far.
+        """
+        return base64.b64encode(self._digest.digest()).decode('ascii')
+
+
+def upload_file_to_s3(s3_client: boto3.client, bucket_name: str, file_key: str,
+                      file_content: Union[str, bytes, BinaryIO], size_hint: Optional[int] = None,
+                      transfer_config: TransferConfig = TRANSFER_CONFIG) -> UploadResult:
     """
     Upload file content to S3.
 
+    Content known to be smaller than the multipart threshold is sent with a
+    single put_object; anything else goes through a managed multipart upload
+    with several parts in flight at once. Either way S3 validates the upload
+    against a SHA-256 checksum sent with the data. For a single put_object the
+    checksum is computed here with hashlib whenever the content can be read
+    twice, rather than leaving botocore to hash the body itself.
+
+    Streams are never read into memory up front: the multipart upload reads
+    them part by part, so peak memory is about part size times concurrency
+    rather than the size of the content. The size of a seekable stream is
+    measured when no size hint is given.
+
     Args:
         s3_client (boto3.client): The S3 client to use.
         bucket_name (str): The name of the S3 bucket.
         file_key (str): The S3 object key.
-        file_content (str): The content of the file to upload.
+        file_content (Union[str, bytes, BinaryIO]): The content to upload, or a readable binary stream of it.
+            A str is encoded to UTF-8 once here, which copies it; pass bytes or a stream to avoid that.
+        size_hint (Optional[int]): The size of a stream's content in bytes, if known. Ignored for bytes.
+        transfer_config (TransferConfig): The configuration of the managed multipart upload.
+
+    Returns:
+        UploadResult: The ETag and checksums of the object. The managed multipart upload does not
+            expose the response, so on that path the ETag and the S3 checksum are None, and the
+            content checksum is only filled in for non-seekable streams, hashed while they are read
+            for the upload. S3 validates every part against its own SHA-256 either way.
 
     Raises:
         NoCredentialsError: If AWS credentials are not available.
+        ClientError: If S3 rejects the upload.
         Exception: If uploading to S3 fails.
     """
+    if isinstance(file_content, str):
+        file_content = file_content.encode('utf-8')
     try:
-        s3_client.put_object(Bucket=bucket_name, Key=file_key, Body=file_content)
+        seekable = getattr(file_content, 'seekable', lambda: False)()
+        if isinstance(file_content, bytes):
+            size_hint = len(file_content)
+        elif size_hint is None and seekable:
+            position = file_content.tell()
+            size_hint = file_content.seek(0, io.SEEK_END) - position
+            file_content.seek(position)
+        if size_hint is not None and size_hint < MULTIPART_THRESHOLD:
+            if isinstance(file_content, bytes):
+                content_checksum = generate_checksum(file_content)
+                checksum_args = {'ChecksumSHA256': content_checksum}
+            elif seekable:
+                position = file_content.tell()
+                content_checksum = generate_checksum(file_content)
+                file_content.seek(position)
+                checksum_args = {'ChecksumSHA256': content_checksum}
+            else:
+                content_checksum = None
+                checksum_args = {'ChecksumAlgorithm': 'SHA256'}
+            response = s3_client.put_object(Bucket=bucket_name, Key=file_key, Body=file_content,
+                                            **checksum_args)
+            return UploadResult(response.get('ETag'), response.get('ChecksumSHA256'), content_checksum)
+        else:
+            check_connection_pool(s3_client, transfer_config.max_concurrency)
+            reader = content_checksum = None
+            if isinstance(file_content, bytes):
+                file_content = io.BytesIO(file_content)
+            elif not seekable:
+                # Only wrap streams s3transfer would read sequentially anyway, so seekable
+                # bodies keep its seekable input path.
+                reader = file_content = HashingReader(file_content)
+            s3_client.upload_fileobj(file_content, bucket_name, file_key, Config=transfer_config,
+                                     ExtraArgs={'ChecksumAlgorithm': 'SHA256'})
+            if reader is not None:
+                content_checksum = reader.checksum()
+            return UploadResult(None, None, content_checksum)
     except NoCredentialsError:
-        print("AWS credentials not available")
+        logger.error("AWS credentials not available")
+        raise
+    except ClientError as e:
+        error = e.response['Error']
+        logger.error("Failed to upload to S3: code=%s message=%s", error.get('Code'), error.get('Message'))
         raise
     except Exception as e:
-        print(f"Failed to upload to S3: {e}")
+        logger.error("Failed to upload to S3: %s", e)
+        raise
+
+
+def upload_many_to_s3(s3_client: boto3.client, bucket_name: str,
+                      items: List[Tuple[str, Union[str, bytes, BinaryIO]]]) -> List[UploadResult]:
+    """
+    Upload many objects to S3 concurrently over one shared client.
+
+    Up to 32 uploads run at once, so the round-trip latency of each request
+    overlaps with the others instead of adding up. Items large enough for a
+    multipart upload share the client's connection pool: each one transfers
+    at most pool size // workers parts at once, and never more than a single
+    upload would, so the batch never runs more requests than the pool holds.
+
+    Args:
+        s3_client (boto3.client): The S3 client to use, ideally from make_s3_client.
+        bucket_name (str): The name of the S3 bucket.
+        items (List[Tuple[str, Union[str, bytes, BinaryIO]]]): Pairs of S3 object key and content to upload.
+
+    Returns:
+        List[UploadResult]: The result of each upload, in the order of the items.
+
+    Raises:
+        Exception: If any upload fails.
+    """
+    if not items:
+        return []
+    max_workers = min(32, len(items))
+    check_connection_pool(s3_client, max_workers)
+    max_pool = s3_client.meta.config.max_pool_connections
+    transfer_config = TransferConfig(multipart_threshold=MULTIPART_THRESHOLD,
+                                     multipart_chunksize=MULTIPART_CHUNKSIZE,
+                                     max_concurrency=min(MAX_CONCURRENCY, max(1, max_pool // max_workers)),
+                                     use_threads=True)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(upload_file_to_s3, s3_client, bucket_name, file_key, file_content,
+                                   transfer_config=transfer_config)
+                   for file_key, file_content in items]
+        return [future.result() for future in futures]
+
+
+def generate_presigned_put_url(s3_client: boto3.client, bucket_name: str, file_key: str,
+                               expires_in: int = 3600) -> str:
+    """
+    Create a presigned URL that lets a worker upload one object with a plain HTTP PUT.
+
+    The request is signed once here, so workers holding the URL need neither
+    AWS credentials nor a boto3 client and do no SigV4 signing per upload.
+
+    Args:
+        s3_client (boto3.client): The S3 client to sign with.
+        bucket_name (str): The name of the S3 bucket.
+        file_key (str): The S3 object key.
+        expires_in (int): The number of seconds the URL stays valid.
+
+    Returns:
+        str: The presigned PUT URL.
+    """
+    return s3_client.generate_presigned_url('put_object',
+                                            Params={'Bucket': bucket_name, 'Key': file_key},
+                                            ExpiresIn=expires_in)
+
+
+def generate_checksum(data: Union[bytes, BinaryIO]) -> str:
+    """
+    Compute the SHA-256 checksum of data in the form S3 expects.
+
+    Streams are hashed from their current position to the end in 1 MiB blocks.
+
+    Args:
+        data (Union[bytes, BinaryIO]): The data to hash, or a readable binary stream of it.
+
+    Returns:
+        str: The base64-encoded SHA-256 digest.
+    """
+    if isinstance(data, bytes):
+        digest = hashlib.sha256(data)
+    else:
+        digest = hashlib.sha256()
+        for block in iter(lambda: data.read(1024 * 1024), b''):
+            digest.update(block)
+    return base64.b64encode(digest.digest()).decode('ascii')
+
+
+def verify_checksum(current: str, received: str) -> bool:
+    """
+    Compare two checksums in constant time.
+
+    Args:
+        current (str): The checksum computed locally.
+        received (str): The checksum reported by S3.
+
+    Returns:
+        bool: True if the checksums match, False otherwise.
+    """
+    return hmac.compare_digest(current, received)
+
+
+def transfer_file_to_s3(hdfs_client: InsecureClient, s3_client: boto3.client, hdfs_path: str, length: int,
+                        bucket_name: str, file_key: str, part_size: int = MULTIPART_CHUNKSIZE,
+                        parallelism: int = MAX_CONCURRENCY) -> UploadResult:
+    """
+    Copy a file from HDFS to S3 as a multipart upload.
+
+    Each worker reads one byte range of the file from HDFS and uploads it as one
+    part, so reads and uploads of different parts overlap and at most
+    ``parallelism`` parts are held in memory at a time. For very large files the
+    part size is raised so the upload stays within S3's limit of 10,000 parts.
+
+    Every part carries its SHA-256 checksum, computed while the part is in
+    memory, so S3 validates the data without a second pass over the file. The
+    checksum S3 reports for the completed object is then checked against the
+    part checksums.
+
+    Args:
+        hdfs_client (InsecureClient): The HDFS client to use.
+        s3_client (boto3.client): The S3 client to use.
+        hdfs_path (str): The path of the file in HDFS.
+        length (int): The size of the file in bytes.
+        bucket_name (str): The name of the S3 bucket.
+        file_key (str): The S3 object key.
+        part_size (int): The number of bytes in each part.
+        parallelism (int): The maximum number of parts transferred at once.
+
+    Returns:
+        UploadResult: The ETag and multipart checksum of the completed object.
+
+    Raises:
+        ValueError: If the checksum of the completed object does not match.
+        Exception: If reading from HDFS or uploading to S3 fails. The multipart
+            upload is aborted so no orphaned parts are left in the bucket.
+    """
+    check_connection_pool(s3_client, parallelism)
+    part_size = get_part_size(length, part_size)
+    part_count = max(1, -(-length // part_size))
+    upload_id = s3_client.create_multipart_upload(Bucket=bucket_name, Key=file_key,
+                                                  ChecksumAlgorithm='SHA256')['UploadId']
+
+    def transfer_part(part_number: int) -> Dict[str, Any]:
+        offset = (part_number - 1) * part_size
+        with hdfs_client.read(hdfs_path, offset=offset, length=min(part_size, length - offset)) as reader:
+            body = reader.read()
+        checksum = generate_checksum(body)
+        response = s3_client.upload_part(Bucket=bucket_name, Key=file_key, UploadId=upload_id,
+                                         PartNumber=part_number, Body=body, ChecksumSHA256=checksum)
+        return {'PartNumber': part_number, 'ETag': response['ETag'], 'ChecksumSHA256': checksum}
+
+    try:
+        with ThreadPoolExecutor(max_workers=parallelism) as executor:
+            parts = list(executor.map(transfer_part, range(1, part_count + 1)))
+        response = s3_client.complete_multipart_upload(Bucket=bucket_name, Key=file_key, UploadId=upload_id,
+                                                       MultipartUpload={'Parts': parts})
+    except Exception as e:
+        logger.error("Failed to transfer file to S3: %s", e)
+        s3_client.abort_multipart_upload(Bucket=bucket_name, Key=file_key, UploadId=upload_id)
         raise
 
+    # S3 reports a multipart checksum as the checksum of the part digests, suffixed with "-<part count>".
+    received = response.get('ChecksumSHA256')
+    if received:
+        expected = generate_checksum(b''.join(base64.b64decode(part['ChecksumSHA256']) for part in parts))
+        if not verify_checksum(expected, received.split('-')[0]):
+            raise ValueError(f"Checksum mismatch for s3://{bucket_name}/{file_key}")
+    return UploadResult(response.get('ETag'), received)
 
-def get_file_group(file_path: str) -> str:
+
+def get_file_status(hdfs_client: InsecureClient, file_path: str) -> Optional[Dict[str, Any]]:
     """
-    Retrieve the group associated with a file in HDFS.
+    Retrieve the status of a file in HDFS, including its group and permission.
 
     Args:
+        hdfs_client (InsecureClient): The HDFS client to use.
         file_path (str): The path to the file in HDFS.
 
     Returns:
-        str: The group name associated with the file, or None if an error occurs.
+        Optional[Dict[str, Any]]: The WebHDFS file status, or None if an error occurs.
     """
     try:
-        result = subprocess.run(['hadoop', 'fs', '-stat', '%g', file_path], capture_output=True, text=True, check=True)
-        print(result)
-        return result.stdout.strip()
-    except subprocess.CalledProcessError as e:
-        print(f"Error getting file group:{e}")
+        return hdfs_client.status(file_path)
+    except HdfsError as e:
+        logger.error("Error getting file status: %s", e)
         return None
 
 
-def get_user_groups(user: str) -> list[str]:
+@functools.lru_cache(maxsize=128)
+def get_user_groups(user: str) -> FrozenSet[str]:
     """
     Retrieve the groups that a user belongs to on the local system.
 
+    Groups are resolved in-process through the system group database; ``id``
+    is only run when the user is unknown to it. Results are cached per user.
+
     Args:
         user (str): The username to query.
 
     Returns:
-        list[str]: A list of group names that the user belongs to.
+        FrozenSet[str]: The names of the groups that the user belongs to.
     """
     try:
-        result = subprocess.run(['id', '-Gn', user], capture_output=True, text=True, check=True)
-        return result.stdout.strip().split()
+        gids = os.getgrouplist(user, pwd.getpwnam(user).pw_gid)
+        return frozenset(grp.getgrgid(gid).gr_name for gid in gids)
+    except KeyError:
+        pass
+    try:
+        result = subprocess.run(['id', '-Gn', user], capture_output=True, check=True,
+                                env={**os.environ, 'LC_ALL': 'C'})
+        return frozenset(os.fsdecode(group) for group in result.stdout.split())
     except subprocess.CalledProcessError as e:
-        print(f"Error getting user groups: {e}")
-        return []
+        logger.error("Error getting user groups: %s", e)
+        return frozenset()
 
 
-def check_user_access(file_path: str, user: str) -> bool:
+def check_user_access(status: Optional[Dict[str, Any]], user: str) -> bool:
     """
-    Check if a user has access to a file in HDFS based on group membership.
+    Check if a user has read access to a file in HDFS.
+
+    World-readable files are accepted without looking up the user's groups;
+    otherwise the user must be a member of the file's group.
 
     Args:
-        file_path (str): The path to the file in HDFS.
+        status (Optional[Dict[str, Any]]): The WebHDFS status of the file, as returned by get_file_status.
         user (str): The username to check.
 
     Returns:
-        bool: True if the user’s group matches the file’s group, False otherwise.
+        bool: True if the file is world-readable or the user is in the file’s group, False otherwise.
     """
-    file_group = get_file_group(file_path)
-    if not file_group:
+    if not status:
         return False
-    user_groups = get_user_groups(user)
-    if file_group in user_groups:
+    if int(status['permission'][-1]) & 4:
         return True
-    return False 
+    return status['group'] in get_user_groups(user)
+
 
 def main() -> None:
     """
     Main function to coordinate HDFS and S3 operations.
     """
     config = load_environment_variables()
-    hdfs_client, s3_client = initialize_clients(config)
 
     try:
-        valid_access = check_user_access(config['hdfs_path'],  config['hdfs_user'])
+        policy = load_transfer_policy(config)
+        hdfs_client, s3_client = initialize_clients(config, policy.parallelism)
+        status = get_file_status(hdfs_client, config['hdfs_path'])
+        valid_access = check_user_access(status, config['hdfs_user'])
         if valid_access:
-            file_content = read_file_from_hdfs(hdfs_client, config['hdfs_path'])
-            print("File content from HDFS:", file_content)
-            upload_file_to_s3(s3_client, config['s3_bucket_name'], config['s3_file_key'], file_content)
-            print("File successfully copied from HDFS to S3.")
+            start = time.monotonic()
+            length = status['length']
+            if length < MULTIPART_THRESHOLD:
+                file_content = read_file_from_hdfs(hdfs_client, config['hdfs_path'])
+                upload_file_to_s3(s3_client, config['s3_bucket_name'], config['s3_file_key'], file_content)
+            else:
+                check_transfer_memory(policy, length)
+                transfer_file_to_s3(hdfs_client, s3_client, config['hdfs_path'], length,
+                                    config['s3_bucket_name'], config['s3_file_key'],
+                                    part_size=policy.part_size, parallelism=policy.parallelism)
+            logger.info("File successfully copied from HDFS to S3 (%d bytes in %.2f s).",
+                        length, time.monotonic() - start)
         else:
-            print("The User doesn't have access to the HDFS file")
+            logger.warning("The User doesn't have access to the HDFS file")
     except Exception as e:
-        print(f"An error occurred: {e}")
+        logger.error("An error occurred: %s", e)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     main()